@@ -13,7 +13,6 @@ Classes:
 Dependencies:
     - can: For interacting with the CAN bus.
     - PyQt5: For the graphical user interface components.
-    - threading: For managing concurrent threads.
     - random: For generating random data.
 
 Usage:
@@ -22,11 +21,12 @@ Usage:
 """
 
 import can
-import time
 import random
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QLineEdit, QCheckBox, QVBoxLayout, QHBoxLayout, QWidget, QSpacerItem, QSizePolicy, QMessageBox
-import threading
+
+# Tabla precalculada byte -> "00".."FF" para no formatear hex en el bucle de envío
+_HEX = [format(b, '02X') for b in range(256)]
 
 class CanSendThread(QThread):
     """
@@ -34,18 +34,19 @@ class CanSendThread(QThread):
 
     Attributes:
         finished (pyqtSignal): Signal emitted when the thread finishes.
-        running (bool): Indicates whether the thread should continue running.
-        semaphore (threading.Semaphore): Semaphore to control concurrent access.
+        send_request (pyqtSignal): Signal emitted to request a send from the GUI thread.
+        data_changed (pyqtSignal): Signal emitted so the GUI thread shows newly drawn data.
         msgid (int): Identifier of the CAN message.
-        data (list): Data of the CAN message.
+        data (bytes): Data of the CAN message.
         id (int): Thread identifier.
         random (bool): Indicates whether random data should be generated.
         seg (int): Time interval between sends in seconds.
     """
 
     finished = pyqtSignal()
-    running = True
-    
+    send_request = pyqtSignal(int, int, object)
+    data_changed = pyqtSignal(int, object)
+
     def __init__(self, id, msgid, data, random, seg):
         """
         Initializes a new thread for sending CAN messages.
@@ -53,7 +54,7 @@ class CanSendThread(QThread):
         Args:
             id (int): Thread identifier.
             msgid (int): Identifier of the CAN message.
-            data (list): Data of the CAN message.
+            data (bytes): Data of the CAN message.
             random (bool): Indicates whether random data should be generated.
             seg (int): Time interval between sends in seconds.
         """
@@ -64,35 +65,38 @@ class CanSendThread(QThread):
         self.id = id
         self.random = random
         self.seg = seg
-        self.running = True
-        self.semaphore = threading.Semaphore(value=1)
 
     def run(self):
         """
         Executes the thread to send CAN messages in a loop.
-        """        
-        while self.running:
-            self.semaphore.acquire()
-            window.send_can_message(self.msgid, self.data)
-            
+        """
+        while not self.isInterruptionRequested():
+            # Emitir sólo valores inmutables; el mensaje reutilizable vive en
+            # MainWindow y se muta en el mismo hilo que hace bus.send
+            self.send_request.emit(self.id, self.msgid, bytes(self.data))
+
             if self.random:
-                self.data = window.reset_can_message(self.id)
+                # Generar los datos en el hilo de trabajo y delegar sólo la
+                # actualización de los widgets al hilo de la interfaz
+                self.data = random.randbytes(8)
+                self.data_changed.emit(self.id, self.data)
 
             if self.seg == 0:
-                self.running = False
-            
-            self.semaphore.release()
-            
-            time.sleep(self.seg)
+                break
+
+            # Dormir en tramos cortos para que Stop responda de inmediato
+            remaining_ms = int(self.seg * 1000)
+            while remaining_ms > 0 and not self.isInterruptionRequested():
+                slice_ms = min(50, remaining_ms)
+                self.msleep(slice_ms)
+                remaining_ms -= slice_ms
         self.finished.emit()
 
     def stop(self):
         """
         Stops the execution of the thread.
         """
-        self.semaphore.acquire()
-        self.running = False
-        self.semaphore.release()
+        self.requestInterruption()
 
 class MainWindow(QMainWindow):
     """
@@ -101,6 +105,7 @@ class MainWindow(QMainWindow):
     Attributes:
         error (bool): Indicates if an error has occurred.
         send_threads (dict): Dictionary that stores active sending threads.
+        rows (dict): Dictionary that stores the widgets of each row, indexed by line number.
     """
     error = False
     send_threads = {}
@@ -157,59 +162,83 @@ class MainWindow(QMainWindow):
 
         self.layout_send.addLayout(row0)
 
-        arb_id = 100
-        for i in range(1, 5): 
-            row = QHBoxLayout()
- 
-            lblEdit = QLabel(" ")
-            setattr(self, f"lblEdit{i}", lblEdit)
-            lblEdit.setStyleSheet("background-color: red")
-            row.addWidget(lblEdit)            
- 
-            line_editDev = QLineEdit()
-            setattr(self, f"txtDev{i}", line_editDev)
-            line_editDev.setText(str(arb_id))
-            line_editDev.setFixedSize(80, 30)
-            row.addWidget(line_editDev)
-
-            for j in range(1, 9):
-                line_edit = QLineEdit()
-                setattr(self, f"txtDev{i}Dato{j}", line_edit)
-                random_decimal = random.randint(0, 255)
-                random_hex = format(random_decimal, '02X')
-                line_edit.setText(random_hex)
-                line_edit.setFixedSize(50, 30)
-                
-                row.addWidget(line_edit)
-
-            txtSeg = QLineEdit()
-            setattr(self, f"txtSeg{i}", txtSeg)
-            txtSeg.setText("3")
-            txtSeg.setFixedSize(30, 20)
-            row.addWidget(txtSeg)
-
-            ckRandom = QCheckBox('Random')
-            setattr(self, f"ckRandom{i}", ckRandom)
-            ckRandom.setChecked(True)
-            row.addWidget(ckRandom)            
-
-            btn_Dev = QPushButton("Send")
-            btn_Dev.clicked.connect(lambda _, line_number=i: self.click_send(line_number))
-            row.addWidget(btn_Dev)
-            
-            btn_StopDev = QPushButton("Stop")
-            btn_StopDev.clicked.connect(lambda _, line_number=i: self.stop_thread(line_number))
-            row.addWidget(btn_StopDev)           
-            
-            self.layout_send.addLayout(row)
-
-            arb_id += 10                    
-        
+        # Referencias directas a los widgets de cada fila, indexadas por
+        # número de fila, para evitar búsquedas getattr por nombre en cada envío
+        self.rows = {}
+        # Buffer de 8 bytes por fila, reutilizado al parsear los campos de datos
+        self._row_buf = {}
+        # Mensaje reutilizable por fila: se muta en send_can_message en lugar
+        # de construir un can.Message nuevo por envío
+        self._row_msg = {}
+
+        for i, arb_id in enumerate(range(100, 140, 10), start=1):
+            self.rows[i] = self._build_row(i, arb_id)
+            self._row_buf[i] = bytearray(8)
+            self._row_msg[i] = can.Message(is_extended_id=False)
+
         # Central Widget
         self.central_widget = QWidget()
         self.central_widget.setLayout(self.layout_send)
         self.setCentralWidget(self.central_widget)
 
+    def _build_row(self, i, arb_id):
+        """
+        Builds the row of widgets for one device and adds it to the layout.
+
+        Args:
+            i (int): Line number of the row.
+            arb_id (int): Initial arbitration identifier shown in the Device field.
+
+        Returns:
+            dict: Widgets of the row, keyed as in self.rows.
+        """
+        row = QHBoxLayout()
+
+        lblEdit = QLabel(" ")
+        lblEdit.setStyleSheet("background-color: red")
+        row.addWidget(lblEdit)
+
+        line_editDev = QLineEdit()
+        line_editDev.setText(str(arb_id))
+        line_editDev.setFixedSize(80, 30)
+        row.addWidget(line_editDev)
+
+        data_edits = []
+        for byte in random.randbytes(8):
+            line_edit = QLineEdit()
+            line_edit.setText(_HEX[byte])
+            line_edit.setFixedSize(50, 30)
+
+            data_edits.append(line_edit)
+            row.addWidget(line_edit)
+
+        txtSeg = QLineEdit()
+        txtSeg.setText("3")
+        txtSeg.setFixedSize(30, 20)
+        row.addWidget(txtSeg)
+
+        ckRandom = QCheckBox('Random')
+        ckRandom.setChecked(True)
+        row.addWidget(ckRandom)
+
+        btn_Dev = QPushButton("Send")
+        btn_Dev.clicked.connect(lambda _, line_number=i: self.click_send(line_number))
+        row.addWidget(btn_Dev)
+
+        btn_StopDev = QPushButton("Stop")
+        btn_StopDev.clicked.connect(lambda _, line_number=i: self.stop_thread(line_number))
+        row.addWidget(btn_StopDev)
+
+        self.layout_send.addLayout(row)
+
+        return {
+            "lblEdit": lblEdit,
+            "dev": line_editDev,
+            "data": data_edits,
+            "seg": txtSeg,
+            "random": ckRandom,
+        }
+
     def click_send(self, line_number):
         """
         Handles the click event of the "Send" button. Starts a thread to send the CAN message.
@@ -220,23 +249,28 @@ class MainWindow(QMainWindow):
         try:
             thread_id = line_number
 
-            if thread_id in self.send_threads:
-                self.stop_thread(thread_id)
+            # Relevo del hilo anterior: interrumpirlo y esperar brevemente
+            # para que no conviva su último envío con el del hilo nuevo
+            old = self.send_threads.get(thread_id)
+            if old is not None:
+                old.stop()
+                old.wait(50)
 
-            msgid = int(getattr(self, f"txtDev{line_number}").text(), 16)
+            row = self.rows[line_number]
+            msgid = int(row["dev"].text(), 16)
+            data = self._read_row_bytes(line_number)
 
-            # Obtener datos del mensaje, ignorar "-" como valores no válidos
-            data = [int(getattr(self, f"txtDev{line_number}Dato{j}").text(), 16) for j in range(1, 9) if getattr(self, f"txtDev{line_number}Dato{j}").text() != "-"]
+            random = row["random"].isChecked()
+            seg = int(row["seg"].text())
 
-            txtSeg = getattr(self, f"txtSeg{line_number}")
-            ckRandom = getattr(self, f"ckRandom{line_number}")
-            random = ckRandom.isChecked()
-            seg = int(txtSeg.text())
+            thread = CanSendThread(line_number, msgid, data, random, seg)
+            thread.send_request.connect(self.send_can_message, Qt.QueuedConnection)
+            thread.data_changed.connect(self.reset_can_message, Qt.QueuedConnection)
+            thread.finished.connect(lambda tid=thread_id, t=thread: self._thread_finished(tid, t))
+            self.send_threads[thread_id] = thread
+            thread.start()
 
-            self.send_threads[thread_id] = CanSendThread(line_number, msgid, data, random, seg)
-            self.send_threads[thread_id].start()
-            
-            lblEdit = getattr(self, f"lblEdit{line_number}")
+            lblEdit = row["lblEdit"]
             lblEdit.setStyleSheet("background-color: green")
 
             if seg == 0:
@@ -246,37 +280,61 @@ class MainWindow(QMainWindow):
             self.message_error(str(e))
             self.stop_thread(line_number)
 
-    def send_can_message(self, message_id, data):
+    def _thread_finished(self, id, thread):
+        """
+        Drops the reference to a finished thread if it is still the current one.
+
+        Args:
+            id (int): Identifier of the thread that finished.
+            thread (CanSendThread): Thread that emitted the finished signal.
+        """
+        if self.send_threads.get(id) is thread:
+            del self.send_threads[id]
+
+    def _read_row_bytes(self, line_number):
+        """
+        Parses the data fields of a row into bytes, ignoring "-" as invalid values.
+
+        Args:
+            line_number (int): Line number indicating the group of input fields.
+
+        Returns:
+            bytes: Parsed data of the row.
+        """
+        buf = self._row_buf[line_number]
+        count = 0
+        for edit in self.rows[line_number]["data"]:
+            text = edit.text()
+            if text != "-":
+                buf[count] = int(text, 16)
+                count += 1
+        return bytes(buf[:count])
+
+    def send_can_message(self, id, message_id, data):
         """
         Sends a CAN message through the bus.
 
         Args:
+            id (int): Identifier of the row the message belongs to.
             message_id (int): Identifier of the CAN message.
-            data (list): Data of the CAN message.
+            data (bytes): Data of the CAN message.
         """
-        message = can.Message(arbitration_id=message_id, data=data, is_extended_id=False)
+        message = self._row_msg[id]
+        message.arbitration_id = message_id
+        message.data = data
+        message.dlc = len(data)
         self.bus.send(message)
-        print(f"Mensaje enviado: ID={message_id}, Datos={data}")
 
-    def reset_can_message(self, id):
+    def reset_can_message(self, id, data):
         """
-        Generates and returns new random data for the CAN message.
+        Updates the data fields of a row with newly generated data.
 
         Args:
-            id (int): Identifier of the message for which data should be generated.
-
-        Returns:
-            list: Newly generated random data.
-        """        
-        for j in range(1, 9):
-            txtDevDato = getattr(self, f"txtDev{id}Dato{j}")
-            random_decimal = random.randint(0, 255)
-            random_hex = format(random_decimal, '02X')
-            txtDevDato.setText(random_hex)
-            
-            data = [int(getattr(self, f"txtDev{id}Dato{j}").text(), 16) for j in range(1, 9) if getattr(self, f"txtDev{id}Dato{j}").text() != "-"]
-            
-        return data
+            id (int): Identifier of the row whose fields should be updated.
+            data (bytes): Newly generated random data.
+        """
+        for txtDevDato, byte in zip(self.rows[id]["data"], data):
+            txtDevDato.setText(_HEX[byte])
 
     def stop_thread(self, id):
         """
@@ -289,8 +347,7 @@ class MainWindow(QMainWindow):
             self.send_threads[id].stop()
             del self.send_threads[id]
 
-            txtDev = getattr(self, f"lblEdit{id}")
-            txtDev.setStyleSheet("background-color: red")
+            self.rows[id]["lblEdit"].setStyleSheet("background-color: red")
 
     def message_error(self, e):
         """